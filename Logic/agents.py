@@ -1,5 +1,7 @@
 import collections
+import queue
 import random
+import threading
 
 class TrafficAgent:
     def __init__(self, epsilon: float, gamma: float, alpha: float):
@@ -96,4 +98,96 @@ class NaiveAgent:
         if self.steps_since_switch >= self.switch_interval:
             self.steps_since_switch = 0
             return "switch"
-        return "stay"
\ No newline at end of file
+        return "stay"
+
+class OnlineTrafficAgent:
+    """Agente para despliegue: actúa con una copia greedy de los pesos y aprende en un hilo aparte.
+    El hilo comparte el GIL con getAction: la mediana y el p99 de la latencia por decisión no cambian,
+    pero el peor caso puede subir a unos milisegundos cuando el intérprete cambia de hilo.
+    Un `publish_every` mayor reduce las copias de pesos; para cotas estrictas el aprendizaje
+    tendría que correr en otro proceso"""
+    def __init__(self, learner: TrafficAgent, epsilon: float = 0.1, epsilon_decay: float = 0.999,
+                 min_epsilon: float = 0.0, min_green: int = 3, queue_size: int = 10000, publish_every: int = 100):
+        self.learner = learner
+        self.epsilon = epsilon
+        self.epsilon_decay = epsilon_decay
+        self.min_epsilon = min_epsilon
+        self.min_green = min_green
+        self.publish_every = publish_every
+        self.transitions = queue.Queue(maxsize=queue_size)
+        self.dropped_transitions = 0
+        # Último error del hilo de aprendizaje; el siguiente update lo reinicia
+        self.learner_error = None
+        # Pasos desde el último "switch" de este agente; empieza en min_green para permitir el primer cambio
+        self.steps_since_switch = min_green
+        # Copia del agente que usa getAction; se reemplaza completa, nunca se modifica
+        self.policy = self._snapshot()
+        self._thread = None
+        self._stopping = threading.Event()
+
+    def _snapshot(self):
+        policy = TrafficAgent(epsilon=0, gamma=self.learner.gamma, alpha=self.learner.alpha)
+        policy.weights = collections.Counter(self.learner.weights)
+        return policy
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._learn_loop, daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Procesa las transiciones pendientes y detiene el hilo; lo reinicia si muere antes de vaciar la cola"""
+        self._stopping.set()
+        while self._thread is not None or not self.transitions.empty():
+            self.start()
+            thread = self._thread
+            thread.join()
+            if self._thread is thread:
+                self._thread = None
+        self._stopping.clear()
+        self.policy = self._snapshot()
+
+    def _learn_loop(self):
+        updates = 0
+        while True:
+            try:
+                transition = self.transitions.get(timeout=0.05)
+            except queue.Empty:
+                if self._stopping.is_set():
+                    break
+                continue
+            try:
+                self.learner.update(*transition)
+            except Exception as error:
+                print(f"Error en el hilo de aprendizaje, se reiniciará en el siguiente update: {error!r}")
+                self.learner_error = error
+                self._thread = None
+                return
+            updates += 1
+            if updates % self.publish_every == 0:
+                # Asignar la referencia es atómico: getAction ve los pesos viejos o los nuevos, nunca una mezcla
+                self.policy = self._snapshot()
+
+    def getAction(self, state):
+        if random.random() < self.epsilon:
+            action = random.choice(["switch", "stay"])
+        else:
+            action = self.policy.computeActionFromQValues(state)
+        self.epsilon = max(self.min_epsilon, self.epsilon * self.epsilon_decay)
+
+        # No cambiar antes de min_green pasos desde el último cambio, en cualquiera de las dos fases
+        self.steps_since_switch += 1
+        if action == "switch":
+            if self.steps_since_switch < self.min_green:
+                return "stay"
+            self.steps_since_switch = 0
+        return action
+
+    def update(self, state, action, nextState, reward):
+        """Encola la transición para el hilo de aprendizaje (lo inicia si no corre); si la cola está llena se descarta"""
+        if self._thread is None:
+            self.start()
+        try:
+            self.transitions.put_nowait((state, action, nextState, reward))
+        except queue.Full:
+            self.dropped_transitions += 1
@@ -40,14 +40,35 @@ class TrafficLight:
             self.time_green += 1
 
 class Intersection:
-    def __init__(self, eagerness_distribution: str = "poisson"):
+    def __init__(self, eagerness_distribution: str = "poisson", scenario=None, seed: int = None, num_steps: int = None):
         self.ns_traffic_light = TrafficLight("NS")
         self.we_traffic_light = TrafficLight("WE")
         self.ns_cars = []
         self.we_cars = []
         self.eagerness_distribution = eagerness_distribution
+        # Llegadas precompiladas del escenario (None usa las probabilidades originales).
+        # num_steps es la duración del episodio; por defecto la del escenario
+        self.ns_arrivals = None
+        self.we_arrivals = None
+        if scenario is not None:
+            ns_arrivals, we_arrivals = scenario.compile(seed, num_steps)
+            self.ns_arrivals = ns_arrivals.tolist()
+            self.we_arrivals = we_arrivals.tolist()
+            self._arrival_index = 0
         
     def add_car(self):
+        if self.ns_arrivals is not None:
+            t = self._arrival_index
+            if t >= len(self.ns_arrivals):
+                raise ValueError(f"El escenario se compiló para {len(self.ns_arrivals)} pasos; "
+                                 "pase num_steps con la duración del episodio")
+            for _ in range(self.ns_arrivals[t]):
+                self.ns_cars.append(Car("NS", eagerness_distribution=self.eagerness_distribution))
+            for _ in range(self.we_arrivals[t]):
+                self.we_cars.append(Car("WE", eagerness_distribution=self.eagerness_distribution))
+            self._arrival_index += 1
+            return
+        
         p = random.uniform(0,1)
         q = random.uniform(0,1)
         if p < 0.5:
@@ -0,0 +1,90 @@
+import numpy as np
+
+class DemandCurve:
+    """Tasa de llegada por paso para un sentido, definida por tramos"""
+    def __init__(self, rates, period: int = None, batch: bool = False):
+        # rates: lista de (paso_inicial, tasa); cada tasa rige hasta el siguiente tramo
+        self.rates = sorted(rates)
+        for start, rate in self.rates:
+            if rate < 0:
+                raise ValueError(f"Tasa negativa: {rate} en el paso {start}")
+            if period is not None and not 0 <= start < period:
+                raise ValueError(f"El tramo que empieza en el paso {start} queda fuera del periodo ({period})")
+        # period: si se da, la curva se repite cada `period` pasos (p. ej. un día)
+        self.period = period
+        # batch: True para llegadas Poisson (varios carros por paso), False para a lo sumo uno (Bernoulli)
+        self.batch = batch
+
+    def rate_array(self, num_steps: int):
+        length = self.period if self.period is not None else num_steps
+        curve = np.zeros(length)
+        for i, (start, rate) in enumerate(self.rates):
+            end = self.rates[i + 1][0] if i + 1 < len(self.rates) else length
+            curve[start:end] = rate
+        if self.period is not None:
+            curve = np.tile(curve, num_steps // self.period + 1)[:num_steps]
+        return curve
+
+class Surge:
+    """Incidente: durante `duration` pasos llegan carros extra (Poisson) por un sentido"""
+    def __init__(self, lane: str, start: int, duration: int, rate: float):
+        self.lane = lane
+        self.start = start
+        self.duration = duration
+        self.rate = rate
+
+class Scenario:
+    """Demanda declarativa de la intersección; se precompila en arreglos de llegadas por paso"""
+    def __init__(self, name: str, ns: DemandCurve, we: DemandCurve, surges=(), num_steps: int = 500):
+        self.name = name
+        self.ns = ns
+        self.we = we
+        self.surges = list(surges)
+        self.num_steps = num_steps
+
+    def _sample(self, curve: DemandCurve, lane: str, num_steps: int, rng):
+        rates = curve.rate_array(num_steps)
+        if curve.batch:
+            arrivals = rng.poisson(rates)
+        else:
+            arrivals = (rng.random(num_steps) < rates).astype(int)
+        for surge in self.surges:
+            if surge.lane == lane:
+                end = min(surge.start + surge.duration, num_steps)
+                arrivals[surge.start:end] += rng.poisson(surge.rate, max(0, end - surge.start))
+        return arrivals
+
+    def compile(self, seed: int = None, num_steps: int = None):
+        """Retorna (llegadas_ns, llegadas_we): cantidad de carros que llegan en cada paso.
+        `num_steps` permite compilar solo los pasos que va a durar el episodio (por defecto `self.num_steps`)"""
+        if num_steps is None:
+            num_steps = self.num_steps
+        rng = np.random.default_rng(seed) if seed is not None else np.random
+        return self._sample(self.ns, "NS", num_steps, rng), self._sample(self.we, "WE", num_steps, rng)
+
+# Biblioteca de escenarios para entrenamiento, evaluación y pruebas de estrés
+PRESETS = {
+    # Probabilidades originales: 0.5 en NS y 0.2 en WE
+    "default": Scenario("default", DemandCurve([(0, 0.5)]), DemandCurve([(0, 0.2)])),
+    # Hora tranquila, hora pico y de nuevo tranquila
+    "rush_hour": Scenario("rush_hour",
+                          DemandCurve([(0, 0.2), (150, 0.9), (350, 0.3)]),
+                          DemandCurve([(0, 0.1), (150, 0.4), (350, 0.1)])),
+    # Ambos sentidos llegan más rápido de lo que la intersección puede despachar (un carro por paso y sentido)
+    "saturated": Scenario("saturated", DemandCurve([(0, 1.3)], batch=True), DemandCurve([(0, 1.3)], batch=True)),
+    # Picos que se alternan entre sentidos cada 100 pasos
+    "oscillating_peaks": Scenario("oscillating_peaks",
+                                  DemandCurve([(0, 0.8), (100, 0.1)], period=200),
+                                  DemandCurve([(0, 0.1), (100, 0.8)], period=200)),
+    # Demanda normal con un incidente que desborda WE a mitad del episodio
+    "incident": Scenario("incident", DemandCurve([(0, 0.5)]), DemandCurve([(0, 0.2)]),
+                         surges=[Surge("WE", start=200, duration=50, rate=1.5)]),
+    # Corrida larga con la demanda original
+    "million_steps": Scenario("million_steps", DemandCurve([(0, 0.5)]), DemandCurve([(0, 0.2)]),
+                              num_steps=1_000_000),
+}
+
+def get_scenario(name: str):
+    if name not in PRESETS:
+        raise ValueError(f"Escenario desconocido: {name}. Opciones: {', '.join(PRESETS)}")
+    return PRESETS[name]
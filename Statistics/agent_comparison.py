@@ -4,8 +4,9 @@ import numpy as np
 import matplotlib.pyplot as plt
 import random
 
-def evaluate_agent(agent, num_episodes: int, max_steps_per_episode: int, agent_name: str, eagerness_dist: str = "poisson"):
-    """Evalúa un agente y retorna métricas de desempeño"""
+def evaluate_agent(agent, num_episodes: int, max_steps_per_episode: int, agent_name: str, eagerness_dist: str = "poisson", scenario=None, seed: int = None):
+    """Evalúa un agente y retorna métricas de desempeño.
+    Con `seed` cada episodio usa semillas fijas, así distintos agentes ven exactamente el mismo tráfico"""
     total_rewards = []
     avg_queue_lengths = []
     max_queue_lengths = []
@@ -13,7 +14,13 @@ def evaluate_agent(agent, num_episodes: int, max_steps_per_episode: int, agent_n
     switches_count = []
     
     for episode in range(num_episodes):
-        intersection = Intersection(eagerness_distribution=eagerness_dist)
+        episode_seed = None
+        if seed is not None:
+            episode_seed = seed + episode
+            random.seed(episode_seed)
+            np.random.seed(episode_seed)
+        intersection = Intersection(eagerness_distribution=eagerness_dist, scenario=scenario, seed=episode_seed,
+                                    num_steps=max_steps_per_episode)
         state = intersection.getState()
         episode_reward = 0
         episode_queues = []
@@ -55,7 +62,7 @@ def evaluate_agent(agent, num_episodes: int, max_steps_per_episode: int, agent_n
         'all_queues': avg_queue_lengths
     }
 
-def train_rl_agent(num_episodes: int, max_steps_per_episode: int, eagerness_dist: str = "poisson"):
+def train_rl_agent(num_episodes: int, max_steps_per_episode: int, eagerness_dist: str = "poisson", scenario=None):
     """Entrena el agente de RL y registra métricas de aprendizaje"""
     agent = TrafficAgent(epsilon=0.1, gamma=0.9, alpha=0.01)
     
@@ -64,7 +71,8 @@ def train_rl_agent(num_episodes: int, max_steps_per_episode: int, eagerness_dist
     episode_rewards = []  # Recompensa total por episodio
     
     for episode in range(num_episodes):
-        intersection = Intersection(eagerness_distribution=eagerness_dist)
+        intersection = Intersection(eagerness_distribution=eagerness_dist, scenario=scenario,
+                                    num_steps=max_steps_per_episode)
         state = intersection.getState()
         
         episode_reward = 0
@@ -0,0 +1,156 @@
+from Logic.agents import NaiveAgent, TrafficAgent
+from Logic.scenarios import PRESETS, get_scenario
+from Statistics.agent_comparison import evaluate_agent, train_rl_agent
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import json
+import os
+import numpy as np
+import matplotlib.pyplot as plt
+import random
+
+CACHE_PATH = 'Statistics/evaluation_cache.json'
+CHECKPOINT_DIR = 'Statistics/checkpoints'
+
+class GreedyPolicy:
+    """Política greedy de un agente RL entrenado. No consume números aleatorios,
+    así el tráfico generado con una semilla es el mismo para todos los agentes"""
+    def __init__(self, agent: TrafficAgent):
+        self.agent = agent
+
+    def getAction(self, state):
+        return self.agent.computeActionFromQValues(state)
+
+def agent_hash(agent):
+    """Hash del checkpoint del agente: sus pesos aprendidos o su intervalo fijo"""
+    if isinstance(agent, TrafficAgent):
+        checkpoint = {'type': 'TrafficAgent', 'weights': sorted(agent.weights.items())}
+    else:
+        checkpoint = {'type': 'NaiveAgent', 'switch_interval': agent.switch_interval}
+    return hashlib.sha256(json.dumps(checkpoint).encode()).hexdigest()[:16]
+
+def scenario_hash(scenario):
+    """Hash de la definición del escenario, para que editar un preset invalide sus celdas"""
+    curve = lambda c: {'rates': c.rates, 'period': c.period, 'batch': c.batch}
+    definition = {'ns': curve(scenario.ns), 'we': curve(scenario.we),
+                  'surges': [[surge.lane, surge.start, surge.duration, surge.rate] for surge in scenario.surges]}
+    return hashlib.sha256(json.dumps(definition).encode()).hexdigest()[:16]
+
+def load_or_train_agent(eagerness_dist: str, num_episodes: int, max_steps_per_episode: int, seed: int = 42,
+                        checkpoint_dir: str = CHECKPOINT_DIR):
+    """Carga los pesos guardados del agente RL o lo entrena con semillas fijas y los guarda"""
+    path = os.path.join(checkpoint_dir, f"{eagerness_dist}_{num_episodes}x{max_steps_per_episode}_seed{seed}.json")
+    agent = TrafficAgent(epsilon=0.1, gamma=0.9, alpha=0.01)
+    if os.path.exists(path):
+        with open(path) as f:
+            agent.weights.update(json.load(f))
+        print(f"Agente RL ({eagerness_dist}) cargado de '{path}'")
+        return agent
+
+    print(f"=== ENTRENANDO AGENTE RL CON DISTRIBUCIÓN: {eagerness_dist.upper()} ===")
+    random.seed(seed)
+    np.random.seed(seed)
+    agent, _, _ = train_rl_agent(num_episodes=num_episodes, max_steps_per_episode=max_steps_per_episode,
+                                 eagerness_dist=eagerness_dist)
+    os.makedirs(checkpoint_dir, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(dict(agent.weights), f, indent=1)
+    return agent
+
+def _evaluate_cell(args):
+    agent, name, eagerness_dist, scenario_name, seed, num_episodes, max_steps = args
+    policy = GreedyPolicy(agent) if isinstance(agent, TrafficAgent) else NaiveAgent(agent.switch_interval)
+    result = evaluate_agent(policy, num_episodes=num_episodes, max_steps_per_episode=max_steps, agent_name=name,
+                            eagerness_dist=eagerness_dist, scenario=get_scenario(scenario_name), seed=seed)
+    return {key: float(result[key]) for key in ['avg_reward', 'avg_queue', 'max_queue', 'avg_wait_time', 'avg_switches']}
+
+def evaluation_matrix(agents: dict, distributions, scenario_names, seed: int = 0, num_episodes: int = 20,
+                      max_steps: int = 500, cache_path: str = CACHE_PATH, max_workers: int = None):
+    """Evalúa cada agente contra cada (distribución, escenario) con números aleatorios comunes.
+    Las celdas se calculan en paralelo y se guardan en caché por (hash del agente, hash del escenario, semilla)"""
+    cache = {}
+    if cache_path and os.path.exists(cache_path):
+        with open(cache_path) as f:
+            cache = json.load(f)
+
+    columns = [(dist, scenario_name) for scenario_name in scenario_names for dist in distributions]
+    keys = {}
+    pending = []
+    for name, agent in agents.items():
+        checkpoint = agent_hash(agent)
+        for dist, scenario_name in columns:
+            key = f"{checkpoint}|{dist}|{scenario_hash(get_scenario(scenario_name))}|{seed}|{num_episodes}|{max_steps}"
+            keys[(name, dist, scenario_name)] = key
+            if key not in cache:
+                pending.append((key, (agent, name, dist, scenario_name, seed, num_episodes, max_steps)))
+
+    print(f"Celdas en caché: {len(keys) - len(pending)}, por calcular: {len(pending)}")
+    if pending:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for (key, _), cell in zip(pending, executor.map(_evaluate_cell, [args for _, args in pending])):
+                cache[key] = cell
+        if cache_path:
+            with open(cache_path, 'w') as f:
+                json.dump(cache, f, indent=1)
+
+    return {cell: cache[key] for cell, key in keys.items()}, columns
+
+def plot_evaluation_matrix(matrix, agent_names, columns, metric: str = 'avg_reward',
+                           path: str = 'Statistics/Graphs/evaluation_matrix.png'):
+    """Imprime la tabla con los valores crudos y guarda el heatmap normalizado por columna:
+    porcentaje de mejora respecto al mejor agente Naive de la columna (o al mejor agente si no hay Naive)"""
+    values = np.array([[matrix[(name, dist, scenario)][metric] for dist, scenario in columns] for name in agent_names])
+    labels = [f"{dist}\n{scenario}" for dist, scenario in columns]
+
+    # Sin normalizar, los colores solo muestran qué tan difícil es cada escenario
+    higher_is_better = metric == 'avg_reward'
+    naive_rows = [i for i, name in enumerate(agent_names) if 'Naive' in name]
+    reference_rows = naive_rows or list(range(len(agent_names)))
+    reference_name = 'el mejor Naive' if naive_rows else 'el mejor agente'
+    reference = values[reference_rows].max(axis=0) if higher_is_better else values[reference_rows].min(axis=0)
+    improvement = (values - reference) / np.maximum(np.abs(reference), 1e-9) * 100
+    if not higher_is_better:
+        improvement = -improvement
+
+    print(f"\n=== MATRIZ DE EVALUACIÓN ({metric}) ===\n")
+    print(f"{'Agente':<35}" + "".join(f"{f'{dist}/{scenario}':>28}" for dist, scenario in columns))
+    print("-" * (35 + 28 * len(columns)))
+    for name, row in zip(agent_names, values):
+        print(f"{name:<35}" + "".join(f"{value:>28.2f}" for value in row))
+
+    fig, ax = plt.subplots(figsize=(max(8, 1.2 * len(columns)), max(4, 0.6 * len(agent_names))))
+    limit = max(np.abs(improvement).max(), 1e-9)
+    image = ax.imshow(improvement, cmap='RdYlGn', vmin=-limit, vmax=limit, aspect='auto')
+    ax.set_xticks(range(len(columns)))
+    ax.set_xticklabels(labels, rotation=45, ha='right', fontsize=8)
+    ax.set_yticks(range(len(agent_names)))
+    ax.set_yticklabels(agent_names, fontsize=9)
+    for i in range(len(agent_names)):
+        for j in range(len(columns)):
+            ax.text(j, i, f"{improvement[i, j]:+.1f}%", ha='center', va='center', fontsize=7)
+    fig.colorbar(image, ax=ax, label=f"{metric}: % mejor que {reference_name} de la columna")
+    ax.set_title('Generalización entre distribuciones y escenarios', fontsize=14)
+
+    plt.tight_layout()
+    plt.savefig(path, dpi=300, bbox_inches='tight')
+    print(f"\n✓ Matriz guardada en '{path}'")
+
+def run_evaluation_matrix(num_episodes: int = 1000, max_steps_per_episode: int = 500):
+    """Entrena un agente RL por distribución y los evalúa junto a los naive en todas las celdas"""
+    distributions = ["uniform", "poisson", "exponential", "beta", "normal_low"]
+    # million_steps tiene las mismas curvas que default: con episodios cortos solo repetiría sus celdas
+    scenario_names = [name for name in PRESETS if name != "million_steps"]
+
+    agents = {}
+    for eagerness_dist in distributions:
+        agents[f"RL Agent ({eagerness_dist.capitalize()})"] = load_or_train_agent(eagerness_dist, num_episodes,
+                                                                                   max_steps_per_episode)
+    for interval in [5, 10, 15, 20]:
+        agents[f"Naive Agent ({interval} pasos)"] = NaiveAgent(interval)
+
+    matrix, columns = evaluation_matrix(agents, distributions, scenario_names, max_steps=max_steps_per_episode)
+    plot_evaluation_matrix(matrix, list(agents), columns)
+    return matrix
+
+if __name__ == "__main__":
+    run_evaluation_matrix(num_episodes=1000, max_steps_per_episode=500)
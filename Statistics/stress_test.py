@@ -0,0 +1,39 @@
+from Logic.agents import NaiveAgent
+from Logic.scenarios import PRESETS, get_scenario
+from Statistics.agent_comparison import evaluate_agent, train_rl_agent
+import random
+import time
+
+def run_stress_tests(scenario_names=None, eagerness_dist: str = "uniform", max_steps: int = None):
+    """Corre cada escenario de estrés con un agente RL y uno naive, midiendo desempeño y pasos por segundo"""
+    if scenario_names is None:
+        scenario_names = [name for name in PRESETS if name != "default"]
+    
+    print("=== PRUEBAS DE ESTRÉS ===\n")
+    print(f"{'Escenario':<20} {'Agente':<25} {'Recompensa':<15} {'Cola Avg':<12} {'Cola Max':<12} {'Pasos/s':<12}")
+    print("-" * 96)
+    
+    results = []
+    for name in scenario_names:
+        scenario = get_scenario(name)
+        steps = max_steps if max_steps is not None else scenario.num_steps
+        # Entrenar con episodios cortos del mismo escenario
+        rl_agent, _, _ = train_rl_agent(num_episodes=50, max_steps_per_episode=min(steps, 500),
+                                        eagerness_dist=eagerness_dist, scenario=scenario)
+        rl_agent.epsilon = 0
+        
+        for agent, agent_name in [(rl_agent, "RL Agent"), (NaiveAgent(10), "Naive Agent (10 pasos)")]:
+            start = time.perf_counter()
+            result = evaluate_agent(agent, num_episodes=1, max_steps_per_episode=steps, agent_name=agent_name,
+                                    eagerness_dist=eagerness_dist, scenario=scenario)
+            elapsed = time.perf_counter() - start
+            result['scenario'] = name
+            result['steps_per_second'] = steps / elapsed
+            results.append(result)
+            print(f"{name:<20} {agent_name:<25} {result['avg_reward']:>12.1f}  {result['avg_queue']:>10.2f}  {result['max_queue']:>10.2f}  {result['steps_per_second']:>10.0f}")
+    
+    return results
+
+if __name__ == "__main__":
+    random.seed(42)  # Para reproducibilidad
+    run_stress_tests()